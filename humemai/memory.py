@@ -12,6 +12,15 @@ class Memory:
     A Memory represents a relationship between two nodes with an edge connecting them.
     """
 
+    __slots__ = (
+        "head_label",
+        "tail_label",
+        "edge_label",
+        "head_properties",
+        "tail_properties",
+        "edge_properties",
+    )
+
     def __init__(
         self,
         head_label: str,
@@ -80,6 +89,8 @@ class ShortMemory(Memory):
     `current_time`, if not provided, it will be added with the current time.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         head_label: str,
@@ -148,6 +159,8 @@ class LongMemory(Memory):
     value 0.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         head_label: str,
@@ -213,6 +226,8 @@ class LongMemory(Memory):
 class EpisodicMemory(LongMemory):
     """A subclass of LongMemory that represents episodic memories."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         head_label: str,
@@ -272,6 +287,8 @@ class EpisodicMemory(LongMemory):
 class SemanticMemory(LongMemory):
     """A subclass of LongMemory that represents semantic memories."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         head_label: str,
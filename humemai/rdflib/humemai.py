@@ -3,7 +3,7 @@
 # Enable postponed evaluation of annotations (optional but recommended in Python 3.10)
 from __future__ import annotations
 
-import collections
+import functools
 import logging
 import os
 from datetime import datetime
@@ -11,6 +11,7 @@ from typing import Optional, Union
 
 from rdflib import BNode, Graph, Literal, Namespace, URIRef
 from rdflib.namespace import RDF, XSD
+from rdflib.store import Store
 
 
 # Configure logging
@@ -21,17 +22,58 @@ logger = logging.getLogger(__name__)
 humemai = Namespace("https://humem.ai/ontology#")
 
 
+@functools.lru_cache(maxsize=1024)
+def _local_name(uri: URIRef) -> str:
+    """
+    Return the last part of a URIRef after the last '/' or '#'. The same entities
+    and qualifiers are printed over and over, so the results are cached.
+
+    Args:
+        uri (URIRef): The URIRef to process.
+
+    Returns:
+        str: The last part of the URI.
+    """
+    return uri.split("/")[-1].split("#")[-1]
+
+
 class Humemai:
     """
     Memory class for managing both short-term and long-term memories.
     Provides methods to add, retrieve, delete, cluster, and manage memories in the RDF graph.
     """
 
-    def __init__(self):
-        self.graph: Graph = Graph()  # Initialize RDF graph for memory storage
+    def __init__(self, store: Union[str, Store] = "default") -> None:
+        """
+        Initializes a Humemai instance.
+
+        Args:
+            store (str or Store, optional): The rdflib store plugin name, or store
+                instance, that backs the graph. Defaults to rdflib's in-memory store.
+                A store implemented in native code, e.g., "Oxigraph" from the
+                optional oxrdflib package, makes bulk inserts faster. The memories
+                derived from this one (e.g., working memory) use the same kind of
+                store.
+        """
+        self.store: Union[str, Store] = store
+
+        # Initialize RDF graph for memory storage
+        self.graph: Graph = Graph(store=store)
         self.graph.bind("humemai", humemai)
         self.current_statement_id: int = 0  # Counter to track the next unique ID
 
+    def _new_memory(self) -> Humemai:
+        """
+        Create an empty Humemai backed by the same kind of store as this one. A store
+        instance is not shared, since the new memory needs a graph of its own.
+
+        Returns:
+            Humemai: The new, empty Humemai.
+        """
+        if isinstance(self.store, str):
+            return Humemai(store=self.store)
+        return Humemai(store=type(self.store)())
+
     def add_memory(
         self,
         triples: list[tuple[URIRef, URIRef, URIRef]],
@@ -45,14 +87,24 @@ class Humemai:
             triples (list): A list of triples (subject, predicate, object) to be added.
             qualifiers (dict): A dictionary of qualifiers (e.g., location, currentTime).
         """
+        # Validate the qualifiers once, before anything is written to the graph,
+        # rather than once per triple in the loop below
+        for key, value in qualifiers.items():
+            if not isinstance(key, URIRef):
+                raise ValueError(f"Qualifier key {key} must be a URIRef.")
+            if not isinstance(value, (URIRef, Literal)):
+                raise ValueError(
+                    f"Qualifier value {value} must be a URIRef or Literal."
+                )
+
+        # The main triples and reified statements of the whole batch are written with
+        # one addN call. Adding a main triple that already exists is a no-op, so there
+        # is no need to look it up in the graph first.
+        quads: list[tuple] = []
+
         for subj, pred, obj in triples:
             logger.debug(f"Adding triple: ({subj}, {pred}, {obj})")
-
-            if not (subj, pred, obj) in self.graph:
-                self.graph.add((subj, pred, obj))
-                logger.debug(f"Main triple added: ({subj}, {pred}, {obj})")
-            else:
-                logger.debug(f"Main triple already exists: ({subj}, {pred}, {obj})")
+            quads.append((subj, pred, obj, self.graph))
 
             statement: BNode = (
                 BNode()
@@ -61,26 +113,27 @@ class Humemai:
             self.current_statement_id += 1  # Increment for the next memory
 
             # Add the reified statement and unique ID
-            self.graph.add((statement, RDF.type, RDF.Statement))
-            self.graph.add((statement, RDF.subject, subj))
-            self.graph.add((statement, RDF.predicate, pred))
-            self.graph.add((statement, RDF.object, obj))
-            self.graph.add(
-                (statement, humemai.memoryID, Literal(unique_id, datatype=XSD.integer))
-            )  # Add the unique ID
+            quads += [
+                (statement, RDF.type, RDF.Statement, self.graph),
+                (statement, RDF.subject, subj, self.graph),
+                (statement, RDF.predicate, pred, self.graph),
+                (statement, RDF.object, obj, self.graph),
+                (
+                    statement,
+                    humemai.memoryID,
+                    Literal(unique_id, datatype=XSD.integer),
+                    self.graph,
+                ),  # Add the unique ID
+            ]
 
             logger.debug(f"Reified statement created: {statement} with ID {unique_id}")
 
             for key, value in qualifiers.items():
-                if not isinstance(key, URIRef):
-                    raise ValueError(f"Qualifier key {key} must be a URIRef.")
-                if not isinstance(value, (URIRef, Literal)):
-                    raise ValueError(
-                        f"Qualifier value {value} must be a URIRef or Literal."
-                    )
-                self.graph.add((statement, key, value))
+                quads.append((statement, key, value, self.graph))
                 logger.debug(f"Added qualifier: ({statement}, {key}, {value})")
 
+        self.graph.addN(quads)
+
     def delete_memory(self, memory_id: Literal) -> None:
         """
         Delete a memory (reified statement) by its unique ID, including all associated
@@ -181,20 +234,71 @@ class Humemai:
         logger.debug(f"Removed triple: ({subject}, {predicate}, {object_})")
 
         # Find all reified statements for this triple
-        for statement in list(self.graph.subjects(RDF.type, RDF.Statement)):
-            s = self.graph.value(statement, RDF.subject)
-            p = self.graph.value(statement, RDF.predicate)
-            o = self.graph.value(statement, RDF.object)
-            if s == subject and p == predicate and o == object_:
-                logger.debug(f"Removing qualifiers for statement: {statement}")
-                # Remove all triples related to this statement
-                for _, pred_q, obj_q in list(
-                    self.graph.triples((statement, None, None))
-                ):
-                    self.graph.remove((statement, pred_q, obj_q))
-                    logger.debug(
-                        f"Removed qualifier triple: ({statement}, {pred_q}, {obj_q})"
-                    )
+        for statement in self._get_reified_statements(subject, predicate, object_):
+            logger.debug(f"Removing qualifiers for statement: {statement}")
+            # Remove all triples related to this statement
+            for _, pred_q, obj_q in list(self.graph.triples((statement, None, None))):
+                self.graph.remove((statement, pred_q, obj_q))
+                logger.debug(
+                    f"Removed qualifier triple: ({statement}, {pred_q}, {obj_q})"
+                )
+
+    def _get_reified_statements(
+        self, subject: URIRef, predicate: URIRef, object_: URIRef
+    ) -> list[BNode]:
+        """
+        Find the reified statements of a triple through the graph's indexes, instead
+        of scanning every reified statement in the graph.
+
+        Args:
+            subject (URIRef): The subject of the memory triple.
+            predicate (URIRef): The predicate of the memory triple.
+            object_ (URIRef): The object of the memory triple.
+
+        Returns:
+            list: The reified statements whose subject, predicate and object match.
+        """
+        return [
+            statement
+            for statement in self.graph.subjects(RDF.subject, subject)
+            if (statement, RDF.predicate, predicate) in self.graph
+            and (statement, RDF.object, object_) in self.graph
+            and (statement, RDF.type, RDF.Statement) in self.graph
+        ]
+
+    def _get_long_term_neighbors(
+        self, node: URIRef
+    ) -> list[tuple[BNode, tuple[URIRef, URIRef, URIRef], URIRef]]:
+        """
+        Find the long-term memories a node takes part in, as the subject or as the
+        object, through the graph's indexes on rdf:subject and rdf:object.
+
+        Args:
+            node (URIRef): The node whose memories are looked up.
+
+        Returns:
+            list: (statement, triple, neighbor) tuples, where the neighbor is the node
+            at the other end of the memory triple.
+        """
+        neighbors = []
+        # The neighbor of a memory found through rdf:subject is its object, and
+        # vice versa
+        for position, other in ((RDF.subject, 2), (RDF.object, 0)):
+            for statement in self.graph.subjects(position, node):
+                if (statement, RDF.type, RDF.Statement) not in self.graph:
+                    continue
+                if self.is_reified_statement_short_term(statement):
+                    continue  # Skip short-term memories
+
+                triple = (
+                    self.graph.value(statement, RDF.subject),
+                    self.graph.value(statement, RDF.predicate),
+                    self.graph.value(statement, RDF.object),
+                )
+                if triple in self.graph:
+                    neighbors.append((statement, triple, triple[other]))
+
+        return neighbors
 
     def add_short_term_memory(
         self,
@@ -210,7 +314,8 @@ class Humemai:
         """
         if humemai.currentTime not in qualifiers:
             currentTime = Literal(datetime.now().isoformat(), datatype=XSD.dateTime)
-            qualifiers[humemai.currentTime] = currentTime
+            # Copy instead of writing into the caller's (or the shared default) dict
+            qualifiers = {**qualifiers, humemai.currentTime: currentTime}
         else:
             if qualifiers[humemai.currentTime].datatype != XSD.dateTime:
                 raise ValueError(
@@ -370,13 +475,18 @@ class Humemai:
                     rdf:object ?object .
         """
 
-        # Add filters dynamically based on input
-        if subject is not None:
-            query += f"FILTER(?subject = <{subject}>) .\n"
-        if predicate is not None:
-            query += f"FILTER(?predicate = <{predicate}>) .\n"
-        if object_ is not None:
-            query += f"FILTER(?object = <{object_}>) .\n"
+        # Bind the given triple positions up front, so that the basic graph pattern
+        # is evaluated through the graph's subject/predicate/object indexes instead
+        # of being filtered after matching every reified statement.
+        bindings = {
+            var: value
+            for var, value in (
+                ("subject", subject),
+                ("predicate", predicate),
+                ("object", object_),
+            )
+            if value is not None
+        }
 
         # Add qualifier filters
         for key, value in qualifiers.items():
@@ -402,7 +512,7 @@ class Humemai:
         logger.debug(f"Executing SPARQL query:\n{query}")
 
         # Execute the SPARQL query
-        results = self.graph.query(query)
+        results = self.graph.query(query, initBindings=bindings)
 
         # To store reified statements and their corresponding qualifiers
         statement_dict: dict[URIRef, dict] = {}
@@ -438,7 +548,7 @@ class Humemai:
                     ] = qualifier_obj
 
         # Create a new Memory object to store the filtered results
-        filtered_memory = Humemai()
+        filtered_memory = self._new_memory()
 
         # Populate the Memory object with the main triples and their qualifiers
         for statement, data in statement_dict.items():
@@ -480,15 +590,16 @@ class Humemai:
         Returns:
             int: The count of unique memories.
         """
-        unique_memories = set()
-
-        # Iterate over reified statements and extract subject-predicate-object triples
-        for s in self.graph.subjects(RDF.type, RDF.Statement):
-            subj = self.graph.value(s, RDF.subject)
-            pred = self.graph.value(s, RDF.predicate)
-            obj = self.graph.value(s, RDF.object)
+        # Read the subjects, predicates and objects of all the reified statements with
+        # one index scan each, instead of three lookups per reified statement
+        subjects = dict(self.graph.subject_objects(RDF.subject))
+        predicates = dict(self.graph.subject_objects(RDF.predicate))
+        objects = dict(self.graph.subject_objects(RDF.object))
 
-            unique_memories.add((subj, pred, obj))
+        unique_memories = {
+            (subjects.get(s), predicates.get(s), objects.get(s))
+            for s in self.graph.subjects(RDF.type, RDF.Statement)
+        }
 
         return len(unique_memories)
 
@@ -502,6 +613,24 @@ class Humemai:
         """
         return sum(1 for _ in self.graph.subjects(RDF.type, RDF.Statement))
 
+    def _count_statements_with_qualifier(self, qualifier: URIRef) -> int:
+        """
+        Count the reified statements that carry a given qualifier. Only the nodes
+        that have the qualifier are visited, through the graph's predicate index,
+        instead of every reified statement in the graph.
+
+        Args:
+            qualifier (URIRef): The qualifier predicate, e.g., humemai.currentTime.
+
+        Returns:
+            int: The count of reified statements with the qualifier.
+        """
+        return sum(
+            1
+            for statement in self.graph.subjects(qualifier, None, unique=True)
+            if (statement, RDF.type, RDF.Statement) in self.graph
+        )
+
     def get_short_term_memory_count(self) -> int:
         """
         Count the number of short-term memories in the graph.
@@ -511,11 +640,7 @@ class Humemai:
         Returns:
             int: The count of short-term memories.
         """
-        return sum(
-            1
-            for statement in self.graph.subjects(RDF.type, RDF.Statement)
-            if self.graph.value(statement, humemai.currentTime) is not None
-        )
+        return self._count_statements_with_qualifier(humemai.currentTime)
 
     def get_long_term_episodic_memory_count(self) -> int:
         """
@@ -526,11 +651,7 @@ class Humemai:
         Returns:
             int: The count of long-term episodic memories.
         """
-        return sum(
-            1
-            for statement in self.graph.subjects(RDF.type, RDF.Statement)
-            if self.graph.value(statement, humemai.eventTime) is not None
-        )
+        return self._count_statements_with_qualifier(humemai.eventTime)
 
     def get_long_term_semantic_memory_count(self) -> int:
         """
@@ -541,11 +662,7 @@ class Humemai:
         Returns:
             int: The count of long-term semantic memories.
         """
-        return sum(
-            1
-            for statement in self.graph.subjects(RDF.type, RDF.Statement)
-            if self.graph.value(statement, humemai.knownSince) is not None
-        )
+        return self._count_statements_with_qualifier(humemai.knownSince)
 
     def get_long_term_memory_count(self) -> int:
         """
@@ -593,6 +710,9 @@ class Humemai:
         )
 
         subject_filter = filters.get(RDF.subject)
+        if subject_filter is None:
+            logger.debug("No subject filter given. No strength is modified.")
+            return
 
         # Construct SPARQL query using f-strings
         query = f"""
@@ -607,14 +727,14 @@ class Humemai:
                     rdf:predicate ?predicate ;
                     rdf:object ?object ;
                     humemai:strength ?strength .
-            FILTER(?subject = <{subject_filter}>) 
         }}
         """
 
         logger.debug(f"Executing SPARQL query:\n{query}")
 
-        # Execute the query
-        results = self.graph.query(query)
+        # Execute the query with the subject bound, so that only the reified
+        # statements of this subject are visited through the graph's index
+        results = self.graph.query(query, initBindings={"subject": subject_filter})
 
         # Iterate over the matching results and modify the strength for each reified statement
         for row in results:
@@ -838,6 +958,29 @@ class Humemai:
                 f"Updated recalled for statement {statement} to {new_recalled_value}"
             )
 
+    def get_recalled(self, subject: URIRef, predicate: URIRef, object_: URIRef) -> int:
+        """
+        Get the 'recalled' value of a triple, i.e., the highest 'recalled' value among
+        its memories. Memories that were never recalled count as 0.
+
+        Args:
+            subject (URIRef): The subject of the memory triple.
+            predicate (URIRef): The predicate of the memory triple.
+            object_ (URIRef): The object of the memory triple.
+
+        Returns:
+            int: The 'recalled' value, or 0 if the triple has no recalled memory.
+        """
+        return max(
+            (
+                int(self.graph.value(statement, humemai.recalled, default=0))
+                for statement in self._get_reified_statements(
+                    subject, predicate, object_
+                )
+            ),
+            default=0,
+        )
+
     def _strip_namespace(self, uri: Union[URIRef, Literal]) -> str:
         """
         Helper function to strip the namespace and return the last part of a URIRef.
@@ -849,7 +992,7 @@ class Humemai:
             str: The last part of the URI after the last '/' or '#'.
         """
         if isinstance(uri, URIRef):
-            return uri.split("/")[-1].split("#")[-1]
+            return _local_name(uri)
         return str(uri)
 
     def is_reified_statement_short_term(self, statement: URIRef) -> bool:
@@ -885,17 +1028,19 @@ class Humemai:
             working_memory (Memory): The working memory to which the statements and qualifiers are added.
             specific_statement (URIRef, optional): A specific reified statement to process, if provided.
         """
-        for statement in self.graph.subjects(RDF.type, RDF.Statement):
+        # A specific statement is looked up directly, instead of scanning every
+        # reified statement in the graph for it
+        if specific_statement is not None:
+            statements = [specific_statement]
+        else:
+            statements = self.graph.subjects(RDF.type, RDF.Statement)
+
+        for statement in statements:
             s = self.graph.value(statement, RDF.subject)
             p = self.graph.value(statement, RDF.predicate)
             o = self.graph.value(statement, RDF.object)
 
-            if (
-                s == subj
-                and p == pred
-                and o == obj
-                and (specific_statement is None or statement == specific_statement)
-            ):
+            if s == subj and p == pred and o == obj:
                 logger.debug(f"Processing reified statement: {statement}")
 
                 # Retrieve the current recalled value
@@ -945,7 +1090,7 @@ class Humemai:
         Returns:
             Memory: A Memory object containing all short-term memories with their qualifiers.
         """
-        short_term_memory = Humemai()
+        short_term_memory = self._new_memory()
 
         # SPARQL query to retrieve all reified statements with a currentTime qualifier, along with other qualifiers
         query = """
@@ -1027,7 +1172,7 @@ class Humemai:
             Memory: A new Memory object containing all long-term memories (episodic and
             semantic).
         """
-        long_term_memory = Humemai()
+        long_term_memory = self._new_memory()
 
         # SPARQL query to retrieve all reified statements that have either eventTime or knownSince,
         # and do not have a currentTime qualifier
@@ -1285,6 +1430,41 @@ class Humemai:
             print("\n".join(memory_strings))
             return
 
+    def _get_long_term_memories_within_hops(
+        self, trigger_node: URIRef, hops: int
+    ) -> list[tuple[BNode, tuple[URIRef, URIRef, URIRef]]]:
+        """
+        Collect the long-term memories within N hops from the trigger node, hop by
+        hop: the frontier holds the nodes first reached in the previous hop, and
+        every hop reads the long-term memories they take part in. The graph is not
+        modified.
+
+        Args:
+            trigger_node (URIRef): The starting node for memory traversal.
+            hops (int): The number of hops.
+
+        Returns:
+            list: (statement, triple) pairs, in the order they were reached.
+        """
+        memories: dict[BNode, tuple[URIRef, URIRef, URIRef]] = {}
+        frontier = [trigger_node]
+        visited = {trigger_node}
+
+        for _ in range(hops):
+            next_frontier = []
+
+            for node in frontier:
+                for statement, triple, neighbor in self._get_long_term_neighbors(node):
+                    memories.setdefault(statement, triple)
+
+                    if isinstance(neighbor, URIRef) and neighbor not in visited:
+                        next_frontier.append(neighbor)
+                        visited.add(neighbor)
+
+            frontier = next_frontier
+
+        return list(memories.items())
+
     def get_working_memory(
         self,
         trigger_node: Optional[URIRef] = None,
@@ -1311,7 +1491,7 @@ class Humemai:
             Memory: A new Memory object containing the working memory (short-term +
             relevant long-term memories).
         """
-        working_memory = Humemai()
+        working_memory = self._new_memory()
         processed_statements = set()
 
         logger.info(
@@ -1363,81 +1543,17 @@ class Humemai:
                     "trigger_node must be provided when include_all_long_term is False"
                 )
 
-        # Proceed with BFS traversal
-        queue = collections.deque()
-        queue.append((trigger_node, 0))
-        visited = set()
-        visited.add(trigger_node)
-
-        while queue:
-            current_node, current_hop = queue.popleft()
-
-            if current_hop >= hops:
-                continue
-
-            # Explore outgoing triples
-            for p, o in self.graph.predicate_objects(current_node):
-                reified_statements = [
-                    stmt
-                    for stmt in self.graph.subjects(RDF.type, RDF.Statement)
-                    if self.graph.value(stmt, RDF.subject) == current_node
-                    and self.graph.value(stmt, RDF.predicate) == p
-                    and self.graph.value(stmt, RDF.object) == o
-                ]
-
-                for statement in reified_statements:
-                    if self.is_reified_statement_short_term(statement):
-                        continue  # Skip short-term memories
-
-                    if statement not in processed_statements:
-                        working_memory.graph.add((current_node, p, o))
-
-                        # Add the reified statement and increment 'recalled'
-                        self._add_reified_statement_to_working_memory_and_increment_recall(
-                            current_node,
-                            p,
-                            o,
-                            working_memory,
-                            specific_statement=statement,
-                        )
-
-                        processed_statements.add(statement)
-
-                    if isinstance(o, URIRef) and o not in visited:
-                        queue.append((o, current_hop + 1))
-                        visited.add(o)
-
-            # Explore incoming triples
-            for s, p in self.graph.subject_predicates(current_node):
-                reified_statements = [
-                    stmt
-                    for stmt in self.graph.subjects(RDF.type, RDF.Statement)
-                    if self.graph.value(stmt, RDF.subject) == s
-                    and self.graph.value(stmt, RDF.predicate) == p
-                    and self.graph.value(stmt, RDF.object) == current_node
-                ]
-
-                for statement in reified_statements:
-                    if self.is_reified_statement_short_term(statement):
-                        continue  # Skip short-term memories
-
-                    if statement not in processed_statements:
-                        working_memory.graph.add((s, p, current_node))
-
-                        # Add the reified statement and increment 'recalled'
-                        self._add_reified_statement_to_working_memory_and_increment_recall(
-                            s,
-                            p,
-                            current_node,
-                            working_memory,
-                            specific_statement=statement,
-                        )
-
-                        processed_statements.add(statement)
+        # The traversal itself has no side effects; the recalled qualifiers are only
+        # incremented while the reached memories are copied into working memory
+        for statement, (s, p, o) in self._get_long_term_memories_within_hops(
+            trigger_node, hops
+        ):
+            working_memory.graph.add((s, p, o))
 
-                    if isinstance(s, URIRef) and s not in visited:
-                        queue.append((s, current_hop + 1))
-                        visited.add(s)
+            # Add the reified statement and increment 'recalled'
+            self._add_reified_statement_to_working_memory_and_increment_recall(
+                s, p, o, working_memory, specific_statement=statement
+            )
 
         return working_memory
 
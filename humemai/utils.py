@@ -9,10 +9,19 @@ logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+# The canonical YYYY-MM-DDTHH:MM:SS form, compiled once
+_ISO8601_SECONDS = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}")
+
+
 def is_iso8601_datetime(value: str) -> bool:
     """
     Check if the given string is in ISO 8601 datetime format with seconds precision.
 
+    Strings in the canonical YYYY-MM-DDTHH:MM:SS form are parsed with
+    `datetime.fromisoformat`, which is much faster than `datetime.strptime` and
+    accepts exactly the same ones. Everything else still goes through `strptime`,
+    so that the other forms it accepts (e.g., one-digit months) stay valid.
+
     Args:
         value (str): The string to check.
 
@@ -20,7 +29,10 @@ def is_iso8601_datetime(value: str) -> bool:
         bool: True if the string is a valid ISO 8601 datetime, False otherwise.
     """
     try:
-        datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+        if isinstance(value, str) and _ISO8601_SECONDS.fullmatch(value):
+            datetime.fromisoformat(value)
+        else:
+            datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
         return True
     except ValueError:
         return False
@@ -2,6 +2,7 @@
 
 import unittest
 import os
+from types import MappingProxyType
 from datetime import datetime
 from unittest.mock import MagicMock
 from rdflib import RDF, XSD, BNode, Graph, Literal, Namespace, URIRef
@@ -10,6 +11,40 @@ from humemai.rdflib import Humemai
 # Define custom namespace for humemai ontology
 humemai = Namespace("https://humem.ai/ontology#")
 
+# Literals used in the expected mock calls, built once per process
+LIT_NY = Literal("New York", datatype=XSD.string)
+LIT_TS = Literal("2024-04-27T15:00:00", datatype=XSD.dateTime)
+LIT_HAPPY = Literal("happy", datatype=XSD.string)
+LIT_COFFEE = Literal("Coffee meeting", datatype=XSD.string)
+LIT_1 = Literal(1, datatype=XSD.integer)
+LIT_2 = Literal(2, datatype=XSD.integer)
+
+# Qualifier (predicate, object) pairs attached to a reified statement
+QUALIFIERS = [
+    (humemai.location, LIT_NY),
+    (humemai.time, LIT_TS),
+    (humemai.emotion, LIT_HAPPY),
+    (humemai.event, LIT_COFFEE),
+]
+
+# Qualifiers of the memories recalled in TestIncrementRecalled, frozen so that they
+# can be shared by every test
+EPISODIC_QUALIFIERS = MappingProxyType(
+    {
+        humemai.location: Literal("New York"),
+        humemai.eventTime: Literal("2024-04-27T15:00:00", datatype=XSD.dateTime),
+        humemai.emotion: Literal("happy"),
+        humemai.event: Literal("Meeting for coffee"),
+    }
+)
+SEMANTIC_QUALIFIERS = MappingProxyType(
+    {
+        humemai.knownSince: Literal("2024-04-27T15:00:00", datatype=XSD.dateTime),
+        humemai.strength: Literal(5, datatype=XSD.integer),
+        humemai.derivedFrom: Literal("study"),
+    }
+)
+
 
 class TestIncrementRecalled(unittest.TestCase):
 
@@ -18,7 +53,6 @@ class TestIncrementRecalled(unittest.TestCase):
         Set up a fresh Memory instance with episodic and semantic memories.
         """
         self.memory = Humemai()
-        self.humemai = Namespace("https://humem.ai/ontology#")
 
         # Define some triples
         self.triple1 = (
@@ -33,28 +67,10 @@ class TestIncrementRecalled(unittest.TestCase):
             URIRef("https://example.org/entity/Animal"),
         )
 
-        # Define episodic and semantic qualifiers
-        episodic_qualifiers = {
-            self.humemai.location: Literal("New York"),
-            self.humemai.eventTime: Literal(
-                "2024-04-27T15:00:00", datatype=XSD.dateTime
-            ),
-            self.humemai.emotion: Literal("happy"),
-            self.humemai.event: Literal("Meeting for coffee"),
-        }
-
-        semantic_qualifiers = {
-            self.humemai.knownSince: Literal(
-                "2024-04-27T15:00:00", datatype=XSD.dateTime
-            ),
-            self.humemai.strength: Literal(5, datatype=XSD.integer),
-            self.humemai.derivedFrom: Literal("study"),
-        }
-
         # Add episodic and semantic memories
-        self.memory.add_episodic_memory([self.triple1], qualifiers=episodic_qualifiers)
+        self.memory.add_episodic_memory([self.triple1], qualifiers=EPISODIC_QUALIFIERS)
         self.memory.add_semantic_memory(
-            [self.semantic_triple1], qualifiers=semantic_qualifiers
+            [self.semantic_triple1], qualifiers=SEMANTIC_QUALIFIERS
         )
 
     def test_multiple_increments_recalled(self) -> None:
@@ -91,26 +107,54 @@ class TestIncrementRecalled(unittest.TestCase):
             result,
         )
 
+    def test_get_recalled(self) -> None:
+        """Test reading the recalled value of a triple."""
+        # Never recalled, and not a memory at all
+        self.assertEqual(self.memory.get_recalled(*self.triple1), 0)
+        self.assertEqual(
+            self.memory.get_recalled(
+                self.triple1[0], self.triple1[1], self.semantic_triple1[2]
+            ),
+            0,
+        )
+
+        self.memory.increment_recalled()
+        self.memory.increment_recalled(subject=self.triple1[0])
+        self.assertEqual(self.memory.get_recalled(*self.triple1), 2)
+        self.assertEqual(self.memory.get_recalled(*self.semantic_triple1), 1)
+
 
 class TestRefiedMemory(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Example URIs for the test
+        cls.subj = URIRef("https://example.org/person/Alice")
+        cls.pred = URIRef("https://example.org/event/met")
+        cls.obj = URIRef("https://example.org/person/Bob")
+
+        # Example reified statements for the same triple as blank nodes
+        cls.reified_statement = BNode()
+        cls.reified_statement_2 = BNode()
+        cls.reified_statements = frozenset(
+            (cls.reified_statement, cls.reified_statement_2)
+        )
+
+        # Expected calls when both reified statements have their recall bumped to 2
+        cls.EXPECTED_RECALL_CALLS = (
+            unittest.mock.call((cls.reified_statement, humemai.recalled, LIT_2)),
+            unittest.mock.call((cls.reified_statement_2, humemai.recalled, LIT_2)),
+        )
+
     def setUp(self) -> None:
         # Initialize the Memory instance
         self.memory = Humemai()
 
         # Mock the graph object to simulate RDF triples and statements
-        self.memory.graph = MagicMock()
-
-        # Example URIs for the test
-        self.subj = URIRef("https://example.org/person/Alice")
-        self.pred = URIRef("https://example.org/event/met")
-        self.obj = URIRef("https://example.org/person/Bob")
-
-        # Example reified statement as a blank node
-        self.reified_statement = BNode()
+        self.memory.graph = MagicMock(spec=Graph)
 
         # Working memory instance for adding triples
         self.working_memory = Humemai()
-        self.working_memory.graph = MagicMock()
+        self.working_memory.graph = MagicMock(spec=Graph)
 
     def test_add_reified_statement_and_increment_recall(self) -> None:
         """Test that the reified statement is added to working memory and recalled is incremented."""
@@ -124,22 +168,13 @@ class TestRefiedMemory(unittest.TestCase):
 
         # Simulate an initial recalled value of 1
         self.memory.graph.triples.return_value = [
-            (
-                self.reified_statement,
-                URIRef("https://humem.ai/ontology#recalled"),
-                Literal(1, datatype=XSD.integer),
-            )
+            (self.reified_statement, humemai.recalled, LIT_1)
         ]
 
         # Define the side effect function for predicate_objects to return updated 'recalled' value
         def predicate_objects_side_effect(statement):
             if statement == self.reified_statement:
-                return [
-                    (
-                        URIRef("https://humem.ai/ontology#recalled"),
-                        Literal(2, datatype=XSD.integer),
-                    )
-                ]
+                return [(humemai.recalled, LIT_2)]
             return []
 
         self.memory.graph.predicate_objects.side_effect = predicate_objects_side_effect
@@ -151,20 +186,12 @@ class TestRefiedMemory(unittest.TestCase):
 
         # Check that the recall value was incremented to 2
         self.memory.graph.set.assert_called_with(
-            (
-                self.reified_statement,
-                URIRef("https://humem.ai/ontology#recalled"),
-                Literal(2, datatype=XSD.integer),
-            )
+            (self.reified_statement, humemai.recalled, LIT_2)
         )
 
         # Ensure the reified statement was added to the working memory with the updated recall
         self.working_memory.graph.add.assert_any_call(
-            (
-                self.reified_statement,
-                URIRef("https://humem.ai/ontology#recalled"),
-                Literal(2, datatype=XSD.integer),
-            )
+            (self.reified_statement, humemai.recalled, LIT_2)
         )
 
     def test_add_reified_statement_with_no_initial_recall(self) -> None:
@@ -182,12 +209,7 @@ class TestRefiedMemory(unittest.TestCase):
         # Define the side effect function for predicate_objects to return updated 'recalled' value
         def predicate_objects_side_effect(statement):
             if statement == self.reified_statement:
-                return [
-                    (
-                        URIRef("https://humem.ai/ontology#recalled"),
-                        Literal(1, datatype=XSD.integer),
-                    )
-                ]
+                return [(humemai.recalled, LIT_1)]
             return []
 
         self.memory.graph.predicate_objects.side_effect = predicate_objects_side_effect
@@ -199,20 +221,12 @@ class TestRefiedMemory(unittest.TestCase):
 
         # Check that the recall value was set to 1
         self.memory.graph.set.assert_called_with(
-            (
-                self.reified_statement,
-                URIRef("https://humem.ai/ontology#recalled"),
-                Literal(1, datatype=XSD.integer),
-            )
+            (self.reified_statement, humemai.recalled, LIT_1)
         )
 
         # Ensure the reified statement with recall value 1 was added to the working memory
         self.working_memory.graph.add.assert_any_call(
-            (
-                self.reified_statement,
-                URIRef("https://humem.ai/ontology#recalled"),
-                Literal(1, datatype=XSD.integer),
-            )
+            (self.reified_statement, humemai.recalled, LIT_1)
         )
 
     def test_specific_statement_handling(self) -> None:
@@ -221,21 +235,9 @@ class TestRefiedMemory(unittest.TestCase):
         # Mock a specific reified statement that we will process
         specific_statement = BNode()
 
-        # Mock the subjects method to return multiple statements
-        self.memory.graph.subjects.return_value = [
-            self.reified_statement,
-            specific_statement,
-        ]
-
-        # Mock the value method to return subject, predicate, object for both statements
-        self.memory.graph.value.side_effect = [
-            self.subj,
-            self.pred,
-            self.obj,  # For self.reified_statement
-            self.subj,
-            self.pred,
-            self.obj,  # For specific_statement
-        ]
+        # The specific statement is looked up directly, so value is only called for
+        # its subject, predicate and object
+        self.memory.graph.value.side_effect = [self.subj, self.pred, self.obj]
 
         # Simulate no initial recall values
         self.memory.graph.triples.return_value = []
@@ -243,12 +245,7 @@ class TestRefiedMemory(unittest.TestCase):
         # Define the side effect function for predicate_objects to return updated 'recalled' value for specific_statement
         def predicate_objects_side_effect(statement):
             if statement == specific_statement:
-                return [
-                    (
-                        URIRef("https://humem.ai/ontology#recalled"),
-                        Literal(1, datatype=XSD.integer),
-                    )
-                ]
+                return [(humemai.recalled, LIT_1)]
             return []
 
         self.memory.graph.predicate_objects.side_effect = predicate_objects_side_effect
@@ -264,22 +261,17 @@ class TestRefiedMemory(unittest.TestCase):
 
         # Check that only the specific statement was processed
         self.memory.graph.set.assert_called_once_with(
-            (
-                specific_statement,
-                URIRef("https://humem.ai/ontology#recalled"),
-                Literal(1, datatype=XSD.integer),
-            )
+            (specific_statement, humemai.recalled, LIT_1)
         )
 
         # Ensure only the specific statement was added to the working memory
         self.working_memory.graph.add.assert_called_once_with(
-            (
-                specific_statement,
-                URIRef("https://humem.ai/ontology#recalled"),
-                Literal(1, datatype=XSD.integer),
-            )
+            (specific_statement, humemai.recalled, LIT_1)
         )
 
+        # The reified statements of the graph were never scanned
+        self.memory.graph.subjects.assert_not_called()
+
     def test_no_reified_statements(self) -> None:
         """Test that if no reified statements match, nothing is processed."""
 
@@ -300,52 +292,26 @@ class TestRefiedMemory(unittest.TestCase):
     def test_multiple_reified_statements(self) -> None:
         """Test that multiple reified statements for the same triple are processed correctly."""
 
-        # Create additional reified statements for the same triple
-        reified_statement_2 = BNode()
-
         # Mock the subjects method to return multiple reified statements
         self.memory.graph.subjects.return_value = [
             self.reified_statement,
-            reified_statement_2,
+            self.reified_statement_2,
         ]
 
         # Mock the value method to return subject, predicate, object for both statements
-        self.memory.graph.value.side_effect = [
-            self.subj,
-            self.pred,
-            self.obj,  # For self.reified_statement
-            self.subj,
-            self.pred,
-            self.obj,  # For reified_statement_2
-        ]
+        # (once for self.reified_statement, once for self.reified_statement_2)
+        self.memory.graph.value.side_effect = (self.subj, self.pred, self.obj) * 2
 
         # Simulate an initial recall value of 1 for both statements
         self.memory.graph.triples.side_effect = [
-            [
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(1, datatype=XSD.integer),
-                )
-            ],
-            [
-                (
-                    reified_statement_2,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(1, datatype=XSD.integer),
-                )
-            ],
+            [(self.reified_statement, humemai.recalled, LIT_1)],
+            [(self.reified_statement_2, humemai.recalled, LIT_1)],
         ]
 
         # Define the side effect function for predicate_objects to return updated 'recalled' values
         def predicate_objects_side_effect(statement):
-            if statement in [self.reified_statement, reified_statement_2]:
-                return [
-                    (
-                        URIRef("https://humem.ai/ontology#recalled"),
-                        Literal(2, datatype=XSD.integer),
-                    )
-                ]
+            if statement in self.reified_statements:
+                return [(humemai.recalled, LIT_2)]
             return []
 
         self.memory.graph.predicate_objects.side_effect = predicate_objects_side_effect
@@ -355,44 +321,16 @@ class TestRefiedMemory(unittest.TestCase):
             self.subj, self.pred, self.obj, self.working_memory
         )
 
-        # Check that the recall value was incremented to 2 for both statements
-        expected_calls = [
-            unittest.mock.call(
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(2, datatype=XSD.integer),
-                )
-            ),
-            unittest.mock.call(
-                (
-                    reified_statement_2,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(2, datatype=XSD.integer),
-                )
-            ),
-        ]
-        self.memory.graph.set.assert_has_calls(expected_calls, any_order=True)
-
-        # Ensure both reified statements were added to the working memory with updated recall
-        expected_add_calls = [
-            unittest.mock.call(
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(2, datatype=XSD.integer),
-                )
-            ),
-            unittest.mock.call(
-                (
-                    reified_statement_2,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(2, datatype=XSD.integer),
-                )
-            ),
-        ]
-        self.working_memory.graph.add.assert_has_calls(
-            expected_add_calls, any_order=True
+        # Check that the recall value was incremented to 2 for both statements, and
+        # for nothing else
+        self.assertCountEqual(
+            self.EXPECTED_RECALL_CALLS, self.memory.graph.set.call_args_list
+        )
+
+        # Ensure exactly both reified statements were added to the working memory
+        # with updated recall
+        self.assertCountEqual(
+            self.EXPECTED_RECALL_CALLS, self.working_memory.graph.add.call_args_list
         )
 
     def test_set_called_correctly_with_qualifiers(self) -> None:
@@ -406,18 +344,8 @@ class TestRefiedMemory(unittest.TestCase):
 
         # Define the side effect function for triples to return the recalled value separately
         def triples_side_effect(query):
-            if query == (
-                self.reified_statement,
-                URIRef("https://humem.ai/ontology#recalled"),
-                None,
-            ):
-                return [
-                    (
-                        self.reified_statement,
-                        URIRef("https://humem.ai/ontology#recalled"),
-                        Literal(1, datatype=XSD.integer),
-                    )
-                ]
+            if query == (self.reified_statement, humemai.recalled, None):
+                return [(self.reified_statement, humemai.recalled, LIT_1)]
             return []
 
         # Mock the triples method to return recalled value when specifically queried
@@ -426,28 +354,7 @@ class TestRefiedMemory(unittest.TestCase):
         # Define the side effect function for predicate_objects to return updated 'recalled' and qualifiers
         def predicate_objects_side_effect(statement):
             if statement == self.reified_statement:
-                return [
-                    (
-                        URIRef("https://humem.ai/ontology#recalled"),
-                        Literal(2, datatype=XSD.integer),
-                    ),
-                    (
-                        URIRef("https://humem.ai/ontology#location"),
-                        Literal("New York", datatype=XSD.string),
-                    ),
-                    (
-                        URIRef("https://humem.ai/ontology#time"),
-                        Literal("2024-04-27T15:00:00", datatype=XSD.dateTime),
-                    ),
-                    (
-                        URIRef("https://humem.ai/ontology#emotion"),
-                        Literal("happy", datatype=XSD.string),
-                    ),
-                    (
-                        URIRef("https://humem.ai/ontology#event"),
-                        Literal("Coffee meeting", datatype=XSD.string),
-                    ),
-                ]
+                return [(humemai.recalled, LIT_2), *QUALIFIERS]
             return []
 
         # Mock predicate_objects to return the qualifiers and updated recalled value
@@ -460,106 +367,41 @@ class TestRefiedMemory(unittest.TestCase):
 
         # Check that the recall value was incremented to 2
         self.memory.graph.set.assert_called_with(
-            (
-                self.reified_statement,
-                URIRef("https://humem.ai/ontology#recalled"),
-                Literal(2, datatype=XSD.integer),
-            )
+            (self.reified_statement, humemai.recalled, LIT_2)
         )
 
         # Ensure all qualifiers are added to the working memory
-        expected_add_calls = [
-            unittest.mock.call(
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(2, datatype=XSD.integer),
+        for q, v in [(humemai.recalled, LIT_2), *QUALIFIERS]:
+            with self.subTest(qualifier=q):
+                self.working_memory.graph.add.assert_any_call(
+                    (self.reified_statement, q, v)
                 )
-            ),
-            unittest.mock.call(
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#location"),
-                    Literal("New York", datatype=XSD.string),
-                )
-            ),
-            unittest.mock.call(
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#time"),
-                    Literal("2024-04-27T15:00:00", datatype=XSD.dateTime),
-                )
-            ),
-            unittest.mock.call(
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#emotion"),
-                    Literal("happy", datatype=XSD.string),
-                )
-            ),
-            unittest.mock.call(
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#event"),
-                    Literal("Coffee meeting", datatype=XSD.string),
-                )
-            ),
-        ]
-        self.working_memory.graph.add.assert_has_calls(
-            expected_add_calls, any_order=True
-        )
 
     def test_add_reified_statement_and_increment_recall_no_specific_statement(
         self,
     ) -> None:
         """Test that without a specific statement, all matching reified statements are processed."""
 
-        # Create additional reified statement
-        reified_statement_2 = BNode()
-
         # Mock the subjects method to return multiple reified statements
         self.memory.graph.subjects.return_value = [
             self.reified_statement,
-            reified_statement_2,
+            self.reified_statement_2,
         ]
 
         # Mock the value method to return subject, predicate, object for both statements
-        self.memory.graph.value.side_effect = [
-            self.subj,
-            self.pred,
-            self.obj,  # For self.reified_statement
-            self.subj,
-            self.pred,
-            self.obj,  # For reified_statement_2
-        ]
+        # (once for self.reified_statement, once for self.reified_statement_2)
+        self.memory.graph.value.side_effect = (self.subj, self.pred, self.obj) * 2
 
         # Simulate an initial recall value of 1 for both statements
         self.memory.graph.triples.side_effect = [
-            [
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(1, datatype=XSD.integer),
-                )
-            ],
-            [
-                (
-                    reified_statement_2,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(1, datatype=XSD.integer),
-                )
-            ],
+            [(self.reified_statement, humemai.recalled, LIT_1)],
+            [(self.reified_statement_2, humemai.recalled, LIT_1)],
         ]
 
         # Define the side effect function for predicate_objects to return updated 'recalled' values
         def predicate_objects_side_effect(statement):
-            if statement in [self.reified_statement, reified_statement_2]:
-                return [
-                    (
-                        URIRef("https://humem.ai/ontology#recalled"),
-                        Literal(2, datatype=XSD.integer),
-                    )
-                ]
+            if statement in self.reified_statements:
+                return [(humemai.recalled, LIT_2)]
             return []
 
         self.memory.graph.predicate_objects.side_effect = predicate_objects_side_effect
@@ -569,44 +411,16 @@ class TestRefiedMemory(unittest.TestCase):
             self.subj, self.pred, self.obj, self.working_memory
         )
 
-        # Check that the recall value was incremented to 2 for both statements
-        expected_calls = [
-            unittest.mock.call(
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(2, datatype=XSD.integer),
-                )
-            ),
-            unittest.mock.call(
-                (
-                    reified_statement_2,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(2, datatype=XSD.integer),
-                )
-            ),
-        ]
-        self.memory.graph.set.assert_has_calls(expected_calls, any_order=True)
-
-        # Ensure both reified statements were added to the working memory with updated recall
-        expected_add_calls = [
-            unittest.mock.call(
-                (
-                    self.reified_statement,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(2, datatype=XSD.integer),
-                )
-            ),
-            unittest.mock.call(
-                (
-                    reified_statement_2,
-                    URIRef("https://humem.ai/ontology#recalled"),
-                    Literal(2, datatype=XSD.integer),
-                )
-            ),
-        ]
-        self.working_memory.graph.add.assert_has_calls(
-            expected_add_calls, any_order=True
+        # Check that the recall value was incremented to 2 for both statements, and
+        # for nothing else
+        self.assertCountEqual(
+            self.EXPECTED_RECALL_CALLS, self.memory.graph.set.call_args_list
+        )
+
+        # Ensure exactly both reified statements were added to the working memory
+        # with updated recall
+        self.assertCountEqual(
+            self.EXPECTED_RECALL_CALLS, self.working_memory.graph.add.call_args_list
         )
 
 
@@ -10,6 +10,11 @@ from humemai.rdflib import Humemai
 # Define custom namespace for humemai ontology
 humemai = Namespace("https://humem.ai/ontology#")
 
+# Qualifier values used by the short-term fixtures, built once per process
+LIT_TS = Literal("2024-10-03T15:00:00", datatype=XSD.dateTime)
+LIT_NY = Literal("New York", datatype=XSD.string)
+LIT_HAPPY = Literal("happy", datatype=XSD.string)
+
 
 class TestMemoryShortTerm(unittest.TestCase):
 
@@ -94,6 +99,9 @@ class TestMemoryShortTerm(unittest.TestCase):
             "The currentTime should be within the expected range.",
         )
 
+        # The caller's qualifiers must not have been modified
+        self.assertEqual(qualifiers, {self.humemai.location: location})
+
     def test_add_multiple_short_term_memories(self) -> None:
         """
         Test adding multiple triples as short-term memory.
@@ -132,89 +140,66 @@ class TestMemoryShortTerm(unittest.TestCase):
 
 
 class TestGetShortTerm(unittest.TestCase):
-    def setUp(self) -> None:
-        """Set up the test case with a Memory instance and populate the RDF graph."""
-        # Initialize a Memory instance and use an actual Graph instance
-        self.memory = Humemai()
-        self.memory.graph = Graph()
-
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up the terms shared by every test in this class."""
         # Short-term triple
-        self.subj = URIRef("https://example.org/person/Alice")
-        self.pred = URIRef("https://example.org/event/met")
-        self.obj = URIRef("https://example.org/person/Bob")
-
-        # Qualifiers for the short-term memory
-        self.currentTime_qualifier = URIRef("https://humem.ai/ontology#currentTime")
-        self.location_qualifier = URIRef("https://humem.ai/ontology#location")
-        self.emotion_qualifier = URIRef("https://humem.ai/ontology#emotion")
-
-        self.currentTime_literal = Literal("2024-10-03T15:00:00", datatype=XSD.dateTime)
-        self.location_literal = Literal("New York", datatype=XSD.string)
-        self.emotion_literal = Literal("happy", datatype=XSD.string)
+        cls.subj = URIRef("https://example.org/person/Alice")
+        cls.pred = URIRef("https://example.org/event/met")
+        cls.obj = URIRef("https://example.org/person/Bob")
 
         # Create a reified statement for the triple (Alice, met, Bob)
-        self.reified_statement = BNode()
-
-        # Add the reified statement and its qualifiers to the graph
-        self.memory.graph.add((self.reified_statement, RDF.type, RDF.Statement))
-        self.memory.graph.add((self.reified_statement, RDF.subject, self.subj))
-        self.memory.graph.add((self.reified_statement, RDF.predicate, self.pred))
-        self.memory.graph.add((self.reified_statement, RDF.object, self.obj))
-        self.memory.graph.add(
-            (
-                self.reified_statement,
-                self.currentTime_qualifier,
-                self.currentTime_literal,
-            )
-        )
-        self.memory.graph.add(
-            (self.reified_statement, self.location_qualifier, self.location_literal)
-        )
-        self.memory.graph.add(
-            (self.reified_statement, self.emotion_qualifier, self.emotion_literal)
-        )
+        cls.reified_statement = BNode()
+
+    def setUp(self) -> None:
+        """Set up the test case with a Memory instance and populate the RDF graph."""
+        # Initialize a Memory instance and use an actual Graph instance, backed by
+        # rdflib's indexed in-memory store so that pattern lookups hit its indexes
+        self.memory = Humemai()
+        self.memory.graph = Graph(store="Memory")
+
+        # Add the reified statement and its qualifiers to the graph in one batch
+        fixture_triples = [
+            (self.reified_statement, RDF.type, RDF.Statement),
+            (self.reified_statement, RDF.subject, self.subj),
+            (self.reified_statement, RDF.predicate, self.pred),
+            (self.reified_statement, RDF.object, self.obj),
+            (self.reified_statement, humemai.currentTime, LIT_TS),
+            (self.reified_statement, humemai.location, LIT_NY),
+            (self.reified_statement, humemai.emotion, LIT_HAPPY),
+        ]
+        graph = self.memory.graph
+        graph.addN((s, p, o, graph) for s, p, o in fixture_triples)
 
     def testget_short_term_memories(self) -> None:
         """Test that short-term memories with currentTime are correctly retrieved and added to the Memory object."""
         # Call the method to retrieve short-term memories
         short_term_memory = self.memory.get_short_term_memories()
+        triples_set = set(short_term_memory.graph)
 
         # Assertions to check if the triples and their qualifiers were added to the short-term memory
         # Check if the triple (Alice, met, Bob) was added
-        self.assertIn((self.subj, self.pred, self.obj), short_term_memory.graph)
+        self.assertIn((self.subj, self.pred, self.obj), triples_set)
 
         # Check if the reified statement with qualifiers (currentTime, location, emotion) was added
-        reified_statements = list(
-            short_term_memory.graph.triples((None, RDF.type, RDF.Statement))
+        reified_statements = short_term_memory.graph.triples(
+            (None, RDF.type, RDF.Statement)
         )
-        self.assertEqual(len(reified_statements), 1)  # Only one reified statement
+        first = next(reified_statements, None)
+        self.assertIsNotNone(first)
+        self.assertIsNone(next(reified_statements, None))  # Only one reified statement
 
-        reified_statement = reified_statements[0][0]
+        reified_statement = first[0]
 
         # Check if reified statement has the correct subject, predicate, and object
-        self.assertIn(
-            (reified_statement, RDF.subject, self.subj), short_term_memory.graph
-        )
-        self.assertIn(
-            (reified_statement, RDF.predicate, self.pred), short_term_memory.graph
-        )
-        self.assertIn(
-            (reified_statement, RDF.object, self.obj), short_term_memory.graph
-        )
+        self.assertIn((reified_statement, RDF.subject, self.subj), triples_set)
+        self.assertIn((reified_statement, RDF.predicate, self.pred), triples_set)
+        self.assertIn((reified_statement, RDF.object, self.obj), triples_set)
 
         # Check if the correct qualifiers were added
-        self.assertIn(
-            (reified_statement, self.currentTime_qualifier, self.currentTime_literal),
-            short_term_memory.graph,
-        )
-        self.assertIn(
-            (reified_statement, self.location_qualifier, self.location_literal),
-            short_term_memory.graph,
-        )
-        self.assertIn(
-            (reified_statement, self.emotion_qualifier, self.emotion_literal),
-            short_term_memory.graph,
-        )
+        self.assertIn((reified_statement, humemai.currentTime, LIT_TS), triples_set)
+        self.assertIn((reified_statement, humemai.location, LIT_NY), triples_set)
+        self.assertIn((reified_statement, humemai.emotion, LIT_HAPPY), triples_set)
 
     def test_empty_short_term_memory(self) -> None:
         """Test that the method handles an empty graph correctly."""
@@ -225,65 +210,49 @@ class TestGetShortTerm(unittest.TestCase):
         short_term_memory = self.memory.get_short_term_memories()
 
         # Ensure the graph is empty in this case
-        self.assertEqual(
-            len(list(short_term_memory.graph.triples((None, None, None)))), 0
-        )
+        self.assertEqual(len(short_term_memory.graph), 0)
 
     def test_partial_qualifiers_in_short_term_memory(self) -> None:
         """Test that short-term memories handle cases where some qualifiers are missing."""
         # Clear the graph and set up a partial reified statement with only some qualifiers (no emotion)
-        self.memory.graph = Graph()
+        self.memory.graph = Graph(store="Memory")
 
         # Add the reified statement with only currentTime and location qualifiers
-        self.memory.graph.add((self.reified_statement, RDF.type, RDF.Statement))
-        self.memory.graph.add((self.reified_statement, RDF.subject, self.subj))
-        self.memory.graph.add((self.reified_statement, RDF.predicate, self.pred))
-        self.memory.graph.add((self.reified_statement, RDF.object, self.obj))
-        self.memory.graph.add(
-            (
-                self.reified_statement,
-                self.currentTime_qualifier,
-                self.currentTime_literal,
-            )
-        )
-        self.memory.graph.add(
-            (self.reified_statement, self.location_qualifier, self.location_literal)
-        )
+        quads = [
+            (s, p, o, self.memory.graph)
+            for s, p, o in [
+                (self.reified_statement, RDF.type, RDF.Statement),
+                (self.reified_statement, RDF.subject, self.subj),
+                (self.reified_statement, RDF.predicate, self.pred),
+                (self.reified_statement, RDF.object, self.obj),
+                (self.reified_statement, humemai.currentTime, LIT_TS),
+                (self.reified_statement, humemai.location, LIT_NY),
+            ]
+        ]
+        self.memory.graph.addN(quads)
 
         # Call the method to retrieve short-term memories
         short_term_memory = self.memory.get_short_term_memories()
+        triples_set = set(short_term_memory.graph)
 
         # Assertions to check if the triple and available qualifiers were added
-        reified_statements = list(
-            short_term_memory.graph.triples((None, RDF.type, RDF.Statement))
+        reified_statements = short_term_memory.graph.triples(
+            (None, RDF.type, RDF.Statement)
         )
-        self.assertEqual(len(reified_statements), 1)
-        reified_statement = reified_statements[0][0]
+        first = next(reified_statements, None)
+        self.assertIsNotNone(first)
+        self.assertIsNone(next(reified_statements, None))
+        reified_statement = first[0]
 
         # Ensure the triple (Alice, met, Bob) exists
-        self.assertIn((self.subj, self.pred, self.obj), short_term_memory.graph)
+        self.assertIn((self.subj, self.pred, self.obj), triples_set)
 
         # Ensure the reified statement has the correct subject, predicate, object
-        self.assertIn(
-            (reified_statement, RDF.subject, self.subj), short_term_memory.graph
-        )
-        self.assertIn(
-            (reified_statement, RDF.predicate, self.pred), short_term_memory.graph
-        )
-        self.assertIn(
-            (reified_statement, RDF.object, self.obj), short_term_memory.graph
-        )
+        self.assertIn((reified_statement, RDF.subject, self.subj), triples_set)
+        self.assertIn((reified_statement, RDF.predicate, self.pred), triples_set)
+        self.assertIn((reified_statement, RDF.object, self.obj), triples_set)
 
         # Check the available qualifiers (no emotion)
-        self.assertIn(
-            (reified_statement, self.currentTime_qualifier, self.currentTime_literal),
-            short_term_memory.graph,
-        )
-        self.assertIn(
-            (reified_statement, self.location_qualifier, self.location_literal),
-            short_term_memory.graph,
-        )
-        self.assertNotIn(
-            (reified_statement, self.emotion_qualifier, self.emotion_literal),
-            short_term_memory.graph,
-        )
+        self.assertIn((reified_statement, humemai.currentTime, LIT_TS), triples_set)
+        self.assertIn((reified_statement, humemai.location, LIT_NY), triples_set)
+        self.assertNotIn((reified_statement, humemai.emotion, LIT_HAPPY), triples_set)
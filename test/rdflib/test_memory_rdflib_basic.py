@@ -1,10 +1,12 @@
 """Test Memory class"""
 
+import pickle
 import unittest
 import os
 from datetime import datetime
 from unittest.mock import MagicMock
 from rdflib import RDF, XSD, BNode, Graph, Literal, Namespace, URIRef
+from rdflib.plugins.stores.memory import Memory, SimpleMemory
 from humemai.rdflib import Humemai
 
 # Define custom namespace for humemai ontology
@@ -16,6 +18,47 @@ class TestMemory(unittest.TestCase):
         """Set up a fresh Memory instance before each test."""
         self.memory = Humemai()
 
+    def test_store(self) -> None:
+        """Test that the graph is backed by the requested rdflib store."""
+        self.assertIsInstance(self.memory.graph.store, Memory)
+
+        memory = Humemai(store="SimpleMemory")
+        self.assertIsInstance(memory.graph.store, SimpleMemory)
+
+        memory.add_memory(
+            [
+                (
+                    URIRef("https://example.org/person/Alice"),
+                    URIRef("https://example.org/relationship/knows"),
+                    URIRef("https://example.org/person/Bob"),
+                )
+            ],
+            {humemai.location: Literal("New York")},
+        )
+        self.assertEqual(memory.get_memory_count(), 1)
+
+    def test_derived_memory_store(self) -> None:
+        """Test that the memories derived from a memory keep its kind of store."""
+        alice = URIRef("https://example.org/person/Alice")
+        triple = (alice, URIRef("https://example.org/relationship/knows"), alice)
+
+        for store in ("SimpleMemory", SimpleMemory()):
+            with self.subTest(store=store):
+                memory = Humemai(store=store)
+                memory.add_memory(
+                    [triple], {humemai.eventTime: Literal("2024-04-27T15:00:00")}
+                )
+
+                for derived in (
+                    memory.get_memories(),
+                    memory.get_short_term_memories(),
+                    memory.get_long_term_memories(),
+                    memory.get_working_memory(alice, hops=1),
+                ):
+                    self.assertIsInstance(derived.graph.store, SimpleMemory)
+                    # A store instance is never shared with a derived memory
+                    self.assertIsNot(derived.graph.store, memory.graph.store)
+
     def test_add_single_memory_with_qualifiers(self) -> None:
         """Test adding a single triple with qualifiers and check if it's correctly stored."""
         triple = (
@@ -220,12 +263,13 @@ class TestMemoryDelete(unittest.TestCase):
 
 
 class TestMemoryDelete(unittest.TestCase):
-    def setUp(self) -> None:
-        """Set up the memory and add test data before each test."""
-        self.memory = Humemai()
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up the memory and add test data once for the whole class."""
+        memory = Humemai()
 
         # Define multiple triples for episodic and semantic memories
-        self.triples = [
+        cls.triples = [
             (
                 URIRef("https://example.org/person/Alice"),
                 URIRef("https://example.org/event/met"),
@@ -254,7 +298,7 @@ class TestMemoryDelete(unittest.TestCase):
         ]
 
         # Define episodic and semantic qualifiers with URIRef keys
-        self.episodic_qualifiers_1 = {
+        cls.episodic_qualifiers_1 = {
             URIRef("https://humem.ai/ontology#location"): Literal("New York"),
             URIRef("https://humem.ai/ontology#eventTime"): Literal(
                 "2024-04-27T15:00:00", datatype=XSD.dateTime
@@ -262,7 +306,7 @@ class TestMemoryDelete(unittest.TestCase):
             URIRef("https://humem.ai/ontology#emotion"): Literal("happy"),
             URIRef("https://humem.ai/ontology#event"): Literal("Coffee meeting"),
         }
-        self.episodic_qualifiers_2 = {
+        cls.episodic_qualifiers_2 = {
             URIRef("https://humem.ai/ontology#location"): Literal("London"),
             URIRef("https://humem.ai/ontology#eventTime"): Literal(
                 "2024-05-01T10:00:00", datatype=XSD.dateTime
@@ -270,7 +314,7 @@ class TestMemoryDelete(unittest.TestCase):
             URIRef("https://humem.ai/ontology#emotion"): Literal("excited"),
             URIRef("https://humem.ai/ontology#event"): Literal("Conference meeting"),
         }
-        self.episodic_qualifiers_3 = {
+        cls.episodic_qualifiers_3 = {
             URIRef("https://humem.ai/ontology#location"): Literal("Paris"),
             URIRef("https://humem.ai/ontology#eventTime"): Literal(
                 "2024-05-05T18:00:00", datatype=XSD.dateTime
@@ -279,13 +323,13 @@ class TestMemoryDelete(unittest.TestCase):
             URIRef("https://humem.ai/ontology#event"): Literal("Workshop"),
         }
 
-        self.semantic_qualifiers_1 = {
+        cls.semantic_qualifiers_1 = {
             URIRef("https://humem.ai/ontology#derivedFrom"): Literal("animal_research"),
             URIRef("https://humem.ai/ontology#strength"): Literal(
                 5, datatype=XSD.integer
             ),
         }
-        self.semantic_qualifiers_2 = {
+        cls.semantic_qualifiers_2 = {
             URIRef("https://humem.ai/ontology#derivedFrom"): Literal("pet_database"),
             URIRef("https://humem.ai/ontology#strength"): Literal(
                 10, datatype=XSD.integer
@@ -293,104 +337,105 @@ class TestMemoryDelete(unittest.TestCase):
         }
 
         # Add episodic memories using add_memory (no add_long_term_memory)
-        self.memory.add_memory(
-            [self.triples[0]], self.episodic_qualifiers_1
-        )  # Memory ID 0
-        self.memory.add_memory(
-            [self.triples[0]], self.episodic_qualifiers_2
-        )  # Memory ID 1
-        self.memory.add_memory(
-            [self.triples[1]], self.episodic_qualifiers_1
-        )  # Memory ID 2
-        self.memory.add_memory(
-            [self.triples[2]], self.episodic_qualifiers_3
-        )  # Memory ID 3
+        memory.add_memory([cls.triples[0]], cls.episodic_qualifiers_1)  # Memory ID 0
+        memory.add_memory([cls.triples[0]], cls.episodic_qualifiers_2)  # Memory ID 1
+        memory.add_memory([cls.triples[1]], cls.episodic_qualifiers_1)  # Memory ID 2
+        memory.add_memory([cls.triples[2]], cls.episodic_qualifiers_3)  # Memory ID 3
 
         # Add semantic memories using add_memory (no add_long_term_memory)
-        self.memory.add_memory(
-            [self.triples[3]], self.semantic_qualifiers_1
-        )  # Memory ID 4
-        self.memory.add_memory(
-            [self.triples[3]], self.semantic_qualifiers_2
-        )  # Memory ID 5
+        memory.add_memory([cls.triples[3]], cls.semantic_qualifiers_1)  # Memory ID 4
+        memory.add_memory([cls.triples[3]], cls.semantic_qualifiers_2)  # Memory ID 5
 
         # Add a short-term memory
-        self.memory.add_short_term_memory(
-            [self.triples[4]],
+        memory.add_short_term_memory(
+            [cls.triples[4]],
             {URIRef("https://humem.ai/ontology#location"): Literal("Alice's home")},
         )  # Memory ID 6
 
+        # Map each memory ID to its reified statement once, so that assertions don't
+        # have to look it up in the graph again
+        cls._stmt = {
+            i: next(
+                memory.graph.subjects(
+                    humemai.memoryID, Literal(i, datatype=XSD.integer)
+                )
+            )
+            for i in range(7)
+        }
+
+        # Every test unpickles its own copy, since most of them delete memories.
+        # Blank node IDs survive pickling, so the statement map above stays valid.
+        cls.memory_pickle = pickle.dumps(memory, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def setUp(self) -> None:
+        """Give each test a fresh copy of the class's memory."""
+        self.memory = pickle.loads(self.memory_pickle)
+
     def test_memory_retrieval_by_id(self) -> None:
         """Test retrieving memories by ID."""
         memory_0 = self.memory.get_memory_by_id(Literal(0, datatype=XSD.integer))
         self.assertIn(
-            "New York",
-            memory_0["qualifiers"][URIRef("https://humem.ai/ontology#location")],
+            "New York", memory_0["qualifiers"][humemai.location]
         )  # Check in the qualifiers
 
         memory_1 = self.memory.get_memory_by_id(Literal(1, datatype=XSD.integer))
         self.assertIn(
-            "London",
-            memory_1["qualifiers"][URIRef("https://humem.ai/ontology#location")],
+            "London", memory_1["qualifiers"][humemai.location]
         )  # Check in the qualifiers
 
         memory_4 = self.memory.get_memory_by_id(Literal(4, datatype=XSD.integer))
         self.assertIn(
-            "animal_research",
-            memory_4["qualifiers"][URIRef("https://humem.ai/ontology#derivedFrom")],
+            "animal_research", memory_4["qualifiers"][humemai.derivedFrom]
         )  # Check semantic memory
 
         memory_6 = self.memory.get_memory_by_id(Literal(6, datatype=XSD.integer))
         self.assertIn(
-            "Alice's home",
-            memory_6["qualifiers"][URIRef("https://humem.ai/ontology#location")],
+            "Alice's home", memory_6["qualifiers"][humemai.location]
         )  # Check short-term memory
 
-    def test_memory_deletion_by_id(self) -> None:
-        """Test deleting a memory by ID."""
-        self.memory.delete_memory(
-            Literal(1, datatype=XSD.integer)
-        )  # Delete memory ID 1
-        deleted_memory = self.memory.get_memory_by_id(Literal(1, datatype=XSD.integer))
-        self.assertIsNone(deleted_memory)  # Ensure memory ID 1 is deleted
-
-        # Ensure other memories are still present
-        memory_0 = self.memory.get_memory_by_id(Literal(0, datatype=XSD.integer))
-        self.assertIsNotNone(memory_0)
-
-    def test_triple_deletion(self) -> None:
-        """Test deleting a triple and all associated memories."""
-        self.memory.delete_triple(*self.triples[0])
-
-        # Both Memory ID 0 and 1 refer to the triple (Alice, met, Bob), so they should be deleted
-        self.assertIsNone(
-            self.memory.get_memory_by_id(Literal(0, datatype=XSD.integer))
-        )
-        self.assertIsNone(
-            self.memory.get_memory_by_id(Literal(1, datatype=XSD.integer))
-        )
-
-        # Ensure other memories are not affected
-        memory_2 = self.memory.get_memory_by_id(Literal(2, datatype=XSD.integer))
-        memory_3 = self.memory.get_memory_by_id(Literal(3, datatype=XSD.integer))
-        self.assertIsNotNone(memory_2)
-        self.assertIsNotNone(memory_3)
-
-    def test_count_triples_and_memories(self) -> None:
-        """Test counting triples and reified memories."""
-        self.assertEqual(
-            self.memory.get_main_triple_count_except_event(), 5
-        )  # 5 unique triples
-        self.assertEqual(self.memory.get_memory_count(), 7)  # 7 reified memories
-
-    def test_delete_triple_and_memory_count(self) -> None:
-        """Test memory and triple count after deleting a triple."""
-        # Delete triple (Alice, met, Bob) and ensure memory count is updated
-        self.memory.delete_triple(*self.triples[0])
-        self.assertEqual(
-            self.memory.get_main_triple_count_except_event(), 4
-        )  # 1 triple removed
-        self.assertEqual(self.memory.get_memory_count(), 5)  # 2 memories removed
+    def test_delete_scenarios(self) -> None:
+        """Test deleting memories and triples, each case against a fresh copy."""
+        with self.subTest(case="count_triples_and_memories"):
+            self.assertEqual(
+                self.memory.get_main_triple_count_except_event(), 5
+            )  # 5 unique triples
+            self.assertEqual(self.memory.get_memory_count(), 7)  # 7 reified memories
+
+        self.memory = pickle.loads(self.memory_pickle)
+        with self.subTest(case="memory_deletion_by_id"):
+            self.memory.delete_memory(
+                Literal(1, datatype=XSD.integer)
+            )  # Delete memory ID 1
+            deleted_memory = self.memory.get_memory_by_id(
+                Literal(1, datatype=XSD.integer)
+            )
+            self.assertIsNone(deleted_memory)  # Ensure memory ID 1 is deleted
+
+            # Ensure other memories are still present
+            memory_0 = self.memory.get_memory_by_id(Literal(0, datatype=XSD.integer))
+            self.assertIsNotNone(memory_0)
+
+        self.memory = pickle.loads(self.memory_pickle)
+        with self.subTest(case="triple_deletion"):
+            self.memory.delete_triple(*self.triples[0])
+
+            # Both Memory ID 0 and 1 refer to the triple (Alice, met, Bob), so they
+            # should be deleted
+            self.assertNotIn((self._stmt[0], None, None), self.memory.graph)
+            self.assertNotIn((self._stmt[1], None, None), self.memory.graph)
+
+            # Ensure other memories are not affected
+            self.assertIn((self._stmt[2], None, None), self.memory.graph)
+            self.assertIn((self._stmt[3], None, None), self.memory.graph)
+
+        self.memory = pickle.loads(self.memory_pickle)
+        with self.subTest(case="delete_triple_and_memory_count"):
+            # Delete triple (Alice, met, Bob) and ensure memory count is updated
+            self.memory.delete_triple(*self.triples[0])
+            self.assertEqual(
+                self.memory.get_main_triple_count_except_event(), 4
+            )  # 1 triple removed
+            self.assertEqual(self.memory.get_memory_count(), 5)  # 2 memories removed
 
 
 class TestMemoryDeleteWithTime(unittest.TestCase):
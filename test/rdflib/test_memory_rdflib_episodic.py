@@ -1,234 +1,174 @@
 """Test Memory class"""
 
+import pickle
 import unittest
-import os
-from datetime import datetime
-from unittest.mock import MagicMock
-from rdflib import RDF, XSD, BNode, Graph, Literal, Namespace, URIRef
+from types import MappingProxyType
+from rdflib import XSD, Literal, Namespace, URIRef
 from humemai.rdflib import Humemai
 
 # Define custom namespace for humemai ontology
 humemai = Namespace("https://humem.ai/ontology#")
 
+# Namespaces of the working-memory fixture
+ex_person = Namespace("https://example.org/person/")
+ex_entity = Namespace("https://example.org/entity/")
+ex_event = Namespace("https://example.org/event/")
+ex_relationship = Namespace("https://example.org/relationship/")
+
+# Entities and relations of the working-memory fixture, built once per process
+ALICE = ex_person.Alice
+BOB = ex_person.Bob
+CHARLIE = ex_person.Charlie
+DAVID = ex_person.David
+EVE = ex_person.Eve
+JOHN = ex_person.John
+DOG = ex_entity.Dog
+ANIMAL = ex_entity.Animal
+MET = ex_event.met
+INVITED = ex_event.invited
+ATTENDED = ex_event.attended
+KNOWS = ex_relationship.knows
+WORKS_WITH = ex_relationship.worksWith
+IS = ex_relationship["is"]
+OWNS = ex_relationship.owns
+LOVES = ex_relationship.loves
+
+# Triples of the working-memory fixture
+ALICE_MET_BOB = (ALICE, MET, BOB)
+BOB_MET_CHARLIE = (BOB, MET, CHARLIE)
+ALICE_KNOWS_DAVID = (ALICE, KNOWS, DAVID)
+CHARLIE_MET_EVE = (CHARLIE, MET, EVE)
+DAVID_INVITED_ALICE = (DAVID, INVITED, ALICE)
+EVE_WORKS_WITH_BOB = (EVE, WORKS_WITH, BOB)
+CHARLIE_ATTENDED_BOB = (CHARLIE, ATTENDED, BOB)
+DOG_IS_ANIMAL = (DOG, IS, ANIMAL)
+ALICE_OWNS_DOG = (ALICE, OWNS, DOG)
+EVE_MET_ALICE = (EVE, MET, ALICE)
+JOHN_LOVES_ANIMAL = (JOHN, LOVES, ANIMAL)
+
+# Qualifiers of the episodic and semantic memories, frozen so that no test or
+# add_*_memory call can change them for the others
+EPISODIC_QUALIFIERS_1 = MappingProxyType(
+    {
+        humemai.location: Literal("New York"),
+        humemai.eventTime: Literal(
+            "2024-04-27T15:00:00",
+            datatype=XSD.dateTime,
+        ),
+        humemai.emotion: Literal("happy"),
+        humemai.event: Literal("Coffee meeting"),
+    }
+)
+EPISODIC_QUALIFIERS_2 = MappingProxyType(
+    {
+        humemai.location: Literal("London"),
+        humemai.eventTime: Literal(
+            "2024-05-01T10:00:00",
+            datatype=XSD.dateTime,
+        ),
+        humemai.emotion: Literal("excited"),
+        humemai.event: Literal("Conference meeting"),
+    }
+)
+EPISODIC_QUALIFIERS_3 = MappingProxyType(
+    {
+        humemai.location: Literal("Paris"),
+        humemai.eventTime: Literal(
+            "2024-05-03T14:00:00",
+            datatype=XSD.dateTime,
+        ),
+        humemai.emotion: Literal("curious"),
+        humemai.event: Literal("Workshop"),
+    }
+)
+
+SEMANTIC_QUALIFIERS = MappingProxyType(
+    {
+        humemai.knownSince: Literal(
+            "2023-01-01T00:00:00",
+            datatype=XSD.dateTime,
+        ),
+        humemai.derivedFrom: Literal("animal_research"),
+        humemai.strength: Literal(5, datatype=XSD.integer),
+    }
+)
+
 
 class TestAddEpisodic(unittest.TestCase):
 
-    def setUp(self) -> None:
-        """Initialize the Memory and populate it with episodic, semantic, and short-term memories."""
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Populate a master Memory with episodic, semantic, and short-term memories once."""
         # Initialize the memory system
-        self.memory: Memory = Humemai()
+        cls.master_memory: Humemai = Humemai()
 
-        # Define multiple triples
-        self.triples: list[tuple[URIRef, URIRef, URIRef]] = [
-            (
-                URIRef("https://example.org/person/Alice"),
-                URIRef("https://example.org/event/met"),
-                URIRef("https://example.org/person/Bob"),
-            ),
-            (
-                URIRef("https://example.org/person/Bob"),
-                URIRef("https://example.org/event/met"),
-                URIRef("https://example.org/person/Charlie"),
-            ),
-            (
-                URIRef("https://example.org/person/Alice"),
-                URIRef("https://example.org/relationship/knows"),
-                URIRef("https://example.org/person/David"),
-            ),
-            (
-                URIRef("https://example.org/person/Charlie"),
-                URIRef("https://example.org/event/met"),
-                URIRef("https://example.org/person/Eve"),
-            ),
-            (
-                URIRef("https://example.org/person/David"),
-                URIRef("https://example.org/event/invited"),
-                URIRef("https://example.org/person/Alice"),
-            ),
-            (
-                URIRef("https://example.org/person/Eve"),
-                URIRef("https://example.org/relationship/worksWith"),
-                URIRef("https://example.org/person/Bob"),
-            ),
-            (
-                URIRef("https://example.org/person/Charlie"),
-                URIRef("https://example.org/event/attended"),
-                URIRef("https://example.org/person/Bob"),
-            ),
-            (
-                URIRef("https://example.org/entity/Dog"),
-                URIRef("https://example.org/relationship/is"),
-                URIRef("https://example.org/entity/Animal"),
-            ),
-            (
-                URIRef("https://example.org/person/Alice"),
-                URIRef("https://example.org/relationship/owns"),
-                URIRef("https://example.org/entity/Dog"),
-            ),
-            (
-                URIRef("https://example.org/person/Eve"),
-                URIRef("https://example.org/event/met"),
-                URIRef("https://example.org/person/Alice"),
-            ),
-            (
-                URIRef("https://example.org/person/John"),
-                URIRef("https://example.org/relationship/loves"),
-                URIRef("https://example.org/entity/Animal"),
-            ),
-        ]
-
-        # Define qualifiers for episodic memories using URIRef and Literal
-        episodic_qualifiers_1: dict[URIRef, Literal] = {
-            humemai.location: Literal("New York"),
-            humemai.eventTime: Literal(
-                "2024-04-27T15:00:00",
-                datatype=XSD.dateTime,
-            ),
-            humemai.emotion: Literal("happy"),
-            humemai.event: Literal("Coffee meeting"),
-        }
-        episodic_qualifiers_2: dict[URIRef, Literal] = {
-            humemai.location: Literal("London"),
-            humemai.eventTime: Literal(
-                "2024-05-01T10:00:00",
-                datatype=XSD.dateTime,
-            ),
-            humemai.emotion: Literal("excited"),
-            humemai.event: Literal("Conference meeting"),
-        }
-        episodic_qualifiers_3: dict[URIRef, Literal] = {
-            humemai.location: Literal("Paris"),
-            humemai.eventTime: Literal(
-                "2024-05-03T14:00:00",
-                datatype=XSD.dateTime,
-            ),
-            humemai.emotion: Literal("curious"),
-            humemai.event: Literal("Workshop"),
-        }
-
-        # Add episodic memories
-        self.memory.add_episodic_memory(
-            [self.triples[0]], qualifiers=episodic_qualifiers_1
-        )
-        self.memory.add_episodic_memory(
-            [self.triples[1]], qualifiers=episodic_qualifiers_2
-        )
-        self.memory.add_episodic_memory(
-            [self.triples[2]], qualifiers=episodic_qualifiers_3
-        )
-        self.memory.add_episodic_memory(
-            [self.triples[3]], qualifiers=episodic_qualifiers_1
-        )
-        self.memory.add_episodic_memory(
-            [self.triples[4]], qualifiers=episodic_qualifiers_2
-        )
-        self.memory.add_episodic_memory(
-            [self.triples[5]], qualifiers=episodic_qualifiers_3
-        )
-        self.memory.add_episodic_memory(
-            [self.triples[6]], qualifiers=episodic_qualifiers_1
-        )
-        self.memory.add_episodic_memory(
-            [self.triples[7]], qualifiers=episodic_qualifiers_2
+        # Add episodic memories, one call per group of triples sharing qualifiers
+        cls.master_memory.add_episodic_memory(
+            [ALICE_MET_BOB, CHARLIE_MET_EVE, CHARLIE_ATTENDED_BOB, EVE_MET_ALICE],
+            qualifiers=EPISODIC_QUALIFIERS_1,
         )
-        self.memory.add_episodic_memory(
-            [self.triples[8]], qualifiers=episodic_qualifiers_3
+        cls.master_memory.add_episodic_memory(
+            [BOB_MET_CHARLIE, DAVID_INVITED_ALICE, DOG_IS_ANIMAL, JOHN_LOVES_ANIMAL],
+            qualifiers=EPISODIC_QUALIFIERS_2,
         )
-        self.memory.add_episodic_memory(
-            [self.triples[9]], qualifiers=episodic_qualifiers_1
-        )
-        self.memory.add_episodic_memory(
-            [self.triples[10]], qualifiers=episodic_qualifiers_2
+        cls.master_memory.add_episodic_memory(
+            [ALICE_KNOWS_DAVID, EVE_WORKS_WITH_BOB, ALICE_OWNS_DOG],
+            qualifiers=EPISODIC_QUALIFIERS_3,
         )
 
         # Add semantic memories
-        semantic_qualifiers: dict[URIRef, Literal] = {
-            humemai.knownSince: Literal(
-                "2023-01-01T00:00:00",
-                datatype=XSD.dateTime,
-            ),
-            humemai.derivedFrom: Literal("animal_research"),
-            humemai.strength: Literal(5, datatype=XSD.integer),
-        }
-        self.memory.add_semantic_memory(
-            [self.triples[7]], qualifiers=semantic_qualifiers
-        )
-        self.memory.add_semantic_memory(
-            [self.triples[7]], qualifiers=semantic_qualifiers
-        )
-        self.memory.add_semantic_memory(
-            [self.triples[10]], qualifiers=semantic_qualifiers
-        )
-        self.memory.add_semantic_memory(
-            [self.triples[10]], qualifiers=semantic_qualifiers
+        cls.master_memory.add_semantic_memory(
+            [DOG_IS_ANIMAL, DOG_IS_ANIMAL, JOHN_LOVES_ANIMAL, JOHN_LOVES_ANIMAL],
+            qualifiers=SEMANTIC_QUALIFIERS,
         )
 
         # Add short-term memories
-        self.memory.add_short_term_memory(
-            [self.triples[8]], qualifiers={humemai.location: Literal("Alice's home")}
-        )
-        self.memory.add_short_term_memory(
-            [self.triples[8]], qualifiers={humemai.location: Literal("Paris Cafe")}
-        )
-
-        # Add another short-term memory
-        self.memory.add_short_term_memory(
-            [self.triples[9]], qualifiers={humemai.location: Literal("Paris Cafe")}
+        cls.master_memory.add_short_term_memory(
+            [ALICE_OWNS_DOG], qualifiers={humemai.location: Literal("Alice's home")}
         )
-        self.memory.add_short_term_memory(
-            [self.triples[9]], qualifiers={humemai.location: Literal("Paris Cafe")}
+        cls.master_memory.add_short_term_memory(
+            [ALICE_OWNS_DOG, EVE_MET_ALICE, EVE_MET_ALICE],
+            qualifiers={humemai.location: Literal("Paris Cafe")},
         )
 
-    def test_working_memory_hop_0(self) -> None:
-        """Test that hop=0 only retrieves short-term memories involving Alice."""
-        trigger_node: URIRef = URIRef("https://example.org/person/Alice")
-        working_memory = self.memory.get_working_memory(
-            trigger_node=trigger_node, hops=0
+        # Pickled once, so that every test can unpickle its own copy
+        cls.master_pickle = pickle.dumps(
+            cls.master_memory, protocol=pickle.HIGHEST_PROTOCOL
         )
 
-        self.assertEqual(working_memory.get_main_triple_count_except_event(), 2)
-        self.assertEqual(working_memory.get_memory_count(), 4)
-
-    def test_working_memory_hop_1(self) -> None:
-        """Test that hop=1 retrieves immediate neighbors' relationships."""
-        trigger_node: URIRef = URIRef("https://example.org/person/Alice")
-        working_memory = self.memory.get_working_memory(
-            trigger_node=trigger_node, hops=1
-        )
-
-        self.assertEqual(working_memory.get_main_triple_count_except_event(), 5)
-        self.assertEqual(working_memory.get_memory_count(), 9)
-
-    def test_working_memory_hop_2(self) -> None:
-        """Test that hop=2 retrieves 2-hop neighbors' relationships."""
-        trigger_node: URIRef = URIRef("https://example.org/person/Alice")
-        working_memory = self.memory.get_working_memory(
-            trigger_node=trigger_node, hops=2
-        )
-
-        self.assertEqual(working_memory.get_main_triple_count_except_event(), 10)
-        self.assertEqual(working_memory.get_memory_count(), 16)
-
-    def test_working_memory_hop_3(self) -> None:
-        """Test that hop=3 retrieves 3-hop neighbors' relationships."""
-        trigger_node: URIRef = URIRef("https://example.org/person/Alice")
-        working_memory = self.memory.get_working_memory(
-            trigger_node=trigger_node, hops=3
-        )
-
-        self.assertEqual(working_memory.get_main_triple_count_except_event(), 11)
-        self.assertEqual(working_memory.get_memory_count(), 19)
+    def setUp(self) -> None:
+        """
+        Give every test its own copy of the master Memory, since working memory
+        retrieval increments the recalled qualifiers in place.
+        """
+        self.memory: Humemai = pickle.loads(self.master_pickle)
 
-    def test_working_memory_include_all_long_term(self) -> None:
-        """Test that all long-term memories are included when include_all_long_term=True."""
-        working_memory = self.memory.get_working_memory(include_all_long_term=True)
+    def test_working_memory_hops(self) -> None:
+        """
+        Test that hop=0 only retrieves short-term memories involving Alice, that
+        every further hop adds the relationships of the next neighbors, and that
+        include_all_long_term=True retrieves every long-term memory.
+        """
+        # get_working_memory kwargs: (main triple count, memory count)
+        expected = [
+            ({"trigger_node": ALICE, "hops": 0}, (2, 4)),
+            ({"trigger_node": ALICE, "hops": 1}, (5, 9)),
+            ({"trigger_node": ALICE, "hops": 2}, (10, 16)),
+            ({"trigger_node": ALICE, "hops": 3}, (11, 19)),
+            ({"include_all_long_term": True}, (11, 19)),
+        ]
+        for kwargs, (triple_count, memory_count) in expected:
+            with self.subTest(**kwargs):
+                working_memory = self.memory.get_working_memory(**kwargs)
 
-        self.assertEqual(working_memory.get_main_triple_count_except_event(), 11)
-        self.assertEqual(working_memory.get_memory_count(), 19)
+                self.assertEqual(
+                    working_memory.get_main_triple_count_except_event(), triple_count
+                )
+                self.assertEqual(working_memory.get_memory_count(), memory_count)
 
     def test_recalled_value_increment(self) -> None:
         """Test that the recalled value increments correctly."""
-        trigger_node: URIRef = URIRef("https://example.org/person/Alice")
+        trigger_node: URIRef = ALICE
 
         # Retrieve working memory at different hops
         self.memory.get_working_memory(trigger_node=trigger_node, hops=1)
@@ -239,24 +179,16 @@ class TestAddEpisodic(unittest.TestCase):
             trigger_node=trigger_node, hops=3
         )
 
-        # Find an example of a statement and assert its recall count
-        memory_statements = working_memory.graph.triples((None, None, None))
-        for triple in memory_statements:
-            if str(triple[1]) == "met" and str(triple[2]) == "Bob":
-                # Ensure the 'recalled' qualifier has increased properly (should be 3)
-                qualifiers: list[tuple[URIRef, Literal]] = list(
-                    working_memory.graph.predicate_objects(triple[0])
-                )
-                for pred, obj in qualifiers:
-                    if str(pred) == str(humemai.recalled):
-                        self.assertEqual(int(obj), 3)
+        # (Alice, met, Bob) was retrieved once per call above
+        self.assertEqual(working_memory.get_recalled(ALICE, MET, BOB), 3)
+        self.assertEqual(self.memory.get_recalled(ALICE, MET, BOB), 3)
 
+
+class TestAddEpisodicEdgeCases(unittest.TestCase):
     def test_empty_memory(self) -> None:
         """Test that working memory handles empty memory cases."""
         empty_memory_system: Memory = Humemai()
-        working_memory = empty_memory_system.get_working_memory(
-            URIRef("https://example.org/person/Alice"), hops=1
-        )
+        working_memory = empty_memory_system.get_working_memory(ALICE, hops=1)
 
         self.assertEqual(working_memory.get_main_triple_count_except_event(), 0)
         self.assertEqual(working_memory.get_memory_count(), 0)
@@ -264,7 +196,7 @@ class TestAddEpisodic(unittest.TestCase):
     def test_invalid_trigger_node(self) -> None:
         """Test behavior when an invalid trigger node is provided."""
         with self.assertRaises(ValueError):
-            self.memory.get_working_memory(trigger_node=None, hops=1)
+            Humemai().get_working_memory(trigger_node=None, hops=1)
 
 
 class TestMemoryMethods(unittest.TestCase):
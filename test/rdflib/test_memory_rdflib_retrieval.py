@@ -10,15 +10,17 @@ from humemai.rdflib import Humemai
 # Define custom namespace for humemai ontology
 humemai = Namespace("https://humem.ai/ontology#")
 
+# ID of the only memory retrieved by location, compared without int() casts
+ID_0 = Literal(0, datatype=XSD.integer)
 
-class TestMemoryRetrievalAndDeletion(unittest.TestCase):
 
-    def setUp(self) -> None:
-        """Set up the memory system and add initial long-term memories."""
-        self.memory = Humemai()
+class TestMemoryRetrievalAndDeletion(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Define the triples and qualifiers shared, read-only, by every test."""
         # Define multiple triples
-        self.triples = [
+        cls.triples = (
             (
                 URIRef("https://example.org/person/Alice"),
                 URIRef("https://example.org/event/met"),
@@ -29,10 +31,13 @@ class TestMemoryRetrievalAndDeletion(unittest.TestCase):
                 URIRef("https://example.org/event/met"),
                 URIRef("https://example.org/person/Charlie"),
             ),
-        ]
+        )
+
+        # add_memory only iterates its triples, so each one is wrapped once here
+        cls.singletons = tuple((triple,) for triple in cls.triples)
 
         # Define qualifiers with URIRef keys
-        self.episodic_qualifiers_1 = {
+        cls.episodic_qualifiers_1 = {
             URIRef("https://humem.ai/ontology#location"): Literal("New York"),
             URIRef("https://humem.ai/ontology#eventTime"): Literal(
                 "2024-04-27T15:00:00", datatype=XSD.dateTime
@@ -41,7 +46,7 @@ class TestMemoryRetrievalAndDeletion(unittest.TestCase):
             URIRef("https://humem.ai/ontology#event"): Literal("Coffee meeting"),
         }
 
-        self.episodic_qualifiers_2 = {
+        cls.episodic_qualifiers_2 = {
             URIRef("https://humem.ai/ontology#location"): Literal("London"),
             URIRef("https://humem.ai/ontology#eventTime"): Literal(
                 "2024-05-01T10:00:00", datatype=XSD.dateTime
@@ -50,12 +55,16 @@ class TestMemoryRetrievalAndDeletion(unittest.TestCase):
             URIRef("https://humem.ai/ontology#event"): Literal("Conference meeting"),
         }
 
+    def setUp(self) -> None:
+        """Set up the memory system and add initial long-term memories."""
+        self.memory = Humemai()
+
         # Add long-term episodic memories using add_memory
         self.memory.add_memory(
-            [self.triples[0]], self.episodic_qualifiers_1
+            self.singletons[0], self.episodic_qualifiers_1
         )  # Memory ID 0
         self.memory.add_memory(
-            [self.triples[1]], self.episodic_qualifiers_2
+            self.singletons[1], self.episodic_qualifiers_2
         )  # Memory ID 1
 
     def test_retrieve_memories(self) -> None:
@@ -67,14 +76,38 @@ class TestMemoryRetrievalAndDeletion(unittest.TestCase):
         retrieved_memories = self.memory.get_memories(qualifiers=location_qualifier)
 
         # Extract memory IDs from the retrieved memories
+        graph = retrieved_memories.graph
         memory_ids = [
-            int(retrieved_memories.graph.value(statement, humemai.memoryID))
-            for statement in retrieved_memories.graph.subjects(RDF.type, RDF.Statement)
+            graph.value(statement, humemai.memoryID)
+            for statement in graph.subjects(RDF.type, RDF.Statement)
         ]
 
-        # Check if the correct memory was retrieved (Memory ID 0 should be retrieved)
-        self.assertIn(0, memory_ids)
-        self.assertNotIn(1, memory_ids)
+        # Check that exactly the correct memory was retrieved (Memory ID 0), so that a
+        # missing or unexpected ID fails the test
+        self.assertEqual(memory_ids, [ID_0])
+
+    def test_retrieve_memories_by_triple_position(self) -> None:
+        """Test retrieval of memories by any bound subject, predicate or object."""
+        for kwargs, expected in (
+            ({"subject": self.triples[0][0]}, {self.triples[0]}),
+            ({"predicate": self.triples[0][1]}, set(self.triples)),
+            ({"object_": self.triples[1][2]}, {self.triples[1]}),
+            (
+                {"subject": self.triples[1][0], "object_": self.triples[0][2]},
+                set(),
+            ),
+        ):
+            with self.subTest(**kwargs):
+                graph = self.memory.get_memories(**kwargs).graph
+                retrieved = {
+                    (
+                        graph.value(statement, RDF.subject),
+                        graph.value(statement, RDF.predicate),
+                        graph.value(statement, RDF.object),
+                    )
+                    for statement in graph.subjects(RDF.type, RDF.Statement)
+                }
+                self.assertEqual(retrieved, expected)
 
     def test_delete_memory_by_retrieved_id(self) -> None:
         """Test deleting a memory by retrieving its ID and verifying it is deleted."""
@@ -85,23 +118,23 @@ class TestMemoryRetrievalAndDeletion(unittest.TestCase):
         retrieved_memories = self.memory.get_memories(qualifiers=location_qualifier)
 
         # Extract memory IDs from the retrieved memories
+        graph = retrieved_memories.graph
         memory_ids_to_delete = [
-            int(retrieved_memories.graph.value(statement, humemai.memoryID))
-            for statement in retrieved_memories.graph.subjects(RDF.type, RDF.Statement)
+            graph.value(statement, humemai.memoryID)
+            for statement in graph.subjects(RDF.type, RDF.Statement)
         ]
+        self.assertEqual(memory_ids_to_delete, [ID_0])
 
         # Delete the retrieved memory from the original memory system
         for memory_id in memory_ids_to_delete:
-            self.memory.delete_memory(Literal(memory_id, datatype=XSD.integer))
+            self.memory.delete_memory(memory_id)
 
         # Verify that the memory has been deleted
         for memory_id in memory_ids_to_delete:
-            deleted_memory = self.memory.get_memory_by_id(
-                Literal(memory_id, datatype=XSD.integer)
-            )
+            deleted_memory = self.memory.get_memory_by_id(memory_id)
             self.assertIsNone(
                 deleted_memory,
-                f"Memory ID {memory_id} should have been deleted but was not.",
+                f"Memory ID {int(memory_id)} should have been deleted but was not.",
             )
 
     def test_memory_deletion_does_not_affect_others(self) -> None:
@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime, timedelta
+from rdflib import URIRef
 from humemai.memory import (
     Memory,
     ShortMemory,
@@ -8,6 +9,40 @@ from humemai.memory import (
     SemanticMemory,
 )
 
+# The current time, formatted once for the whole module
+ISO_NOW = datetime.now().isoformat(timespec="seconds")
+
+# Expected to_dict() outputs, built once for the whole module
+EXPECTED_MEMORY_DICT = {
+    "head": {"label": "Person", "properties": {"name": "Alice"}},
+    "tail": {"label": "Person", "properties": {"name": "Bob"}},
+    "edge": {"label": "knows", "properties": {"since": 2020}},
+}
+
+EXPECTED_LONG_MEMORY_DICT = {
+    "head": {
+        "label": "Person",
+        "properties": {"name": "Alice", "num_recalled": 0},
+    },
+    "tail": {
+        "label": "Event",
+        "properties": {"event_name": "Workshop", "num_recalled": 0},
+    },
+    "edge": {"label": "remembers", "properties": {"num_recalled": 0}},
+}
+
+
+def expected_short_memory_dict(current_time):
+    """Return the expected to_dict() output of a ShortMemory made at current_time."""
+    return {
+        "head": {"label": "Person", "properties": {"name": "Alice"}},
+        "tail": {"label": "Person", "properties": {"name": "Bob"}},
+        "edge": {
+            "label": "knows",
+            "properties": {"current_time": current_time},
+        },
+    }
+
 
 class TestMemory(unittest.TestCase):
     def test_memory_initialization(self):
@@ -28,6 +63,13 @@ class TestMemory(unittest.TestCase):
         self.assertEqual(memory.tail_properties, {"name": "Bob", "age": 35})
         self.assertEqual(memory.edge_properties, {"since": 2020})
 
+    def test_memory_non_str_labels(self):
+        """Test that labels are stored as given, including str subclasses like URIRef."""
+        head_label = URIRef("https://example.org/Person")
+        memory = Memory(head_label=head_label, tail_label="Person", edge_label="knows")
+
+        self.assertIs(memory.head_label, head_label)
+
     def test_memory_to_dict(self):
         """Test that to_dict returns the correct dictionary representation of a Memory instance."""
         memory = Memory(
@@ -39,19 +81,21 @@ class TestMemory(unittest.TestCase):
             edge_properties={"since": 2020},
         )
 
-        expected_dict = {
-            "head": {"label": "Person", "properties": {"name": "Alice"}},
-            "tail": {"label": "Person", "properties": {"name": "Bob"}},
-            "edge": {"label": "knows", "properties": {"since": 2020}},
-        }
+        self.assertEqual(memory.to_dict(), EXPECTED_MEMORY_DICT)
+
+    def test_memory_uses_slots(self):
+        """Test that a Memory instance has no per-instance __dict__."""
+        memory = Memory(head_label="Person", tail_label="Person", edge_label="knows")
 
-        self.assertEqual(memory.to_dict(), expected_dict)
+        self.assertFalse(hasattr(memory, "__dict__"))
+        with self.assertRaises(AttributeError):
+            memory.unknown_attribute = True
 
 
 class TestShortMemory(unittest.TestCase):
     def test_short_memory_initialization_with_current_time(self):
         """Test that a ShortMemory instance initializes with provided current_time in edge_properties."""
-        current_time = datetime.now().isoformat(timespec="seconds")
+        current_time = ISO_NOW
         edge_properties = {"current_time": current_time, "strength": "strong"}
 
         short_memory = ShortMemory(
@@ -83,7 +127,7 @@ class TestShortMemory(unittest.TestCase):
 
     def test_short_memory_to_dict(self):
         """Test the to_dict method of ShortMemory."""
-        current_time = datetime.now().isoformat(timespec="seconds")
+        current_time = ISO_NOW
         short_memory = ShortMemory(
             head_label="Person",
             tail_label="Person",
@@ -93,16 +137,9 @@ class TestShortMemory(unittest.TestCase):
             edge_properties={"current_time": current_time},
         )
 
-        expected_dict = {
-            "head": {"label": "Person", "properties": {"name": "Alice"}},
-            "tail": {"label": "Person", "properties": {"name": "Bob"}},
-            "edge": {
-                "label": "knows",
-                "properties": {"current_time": current_time},
-            },
-        }
-
-        self.assertEqual(short_memory.to_dict(), expected_dict)
+        self.assertEqual(
+            short_memory.to_dict(), expected_short_memory_dict(current_time)
+        )
 
     def test_short_memory_invalid_current_time(self):
         """Test that an invalid current_time raises a ValueError."""
@@ -156,25 +193,13 @@ class TestLongMemory(unittest.TestCase):
             tail_properties={"event_name": "Workshop"},
         )
 
-        expected_dict = {
-            "head": {
-                "label": "Person",
-                "properties": {"name": "Alice", "num_recalled": 0},
-            },
-            "tail": {
-                "label": "Event",
-                "properties": {"event_name": "Workshop", "num_recalled": 0},
-            },
-            "edge": {"label": "remembers", "properties": {"num_recalled": 0}},
-        }
-
-        self.assertEqual(long_memory.to_dict(), expected_dict)
+        self.assertEqual(long_memory.to_dict(), EXPECTED_LONG_MEMORY_DICT)
 
 
 class TestEpisodicMemory(unittest.TestCase):
     def test_episodic_memory_initialization(self):
         """Test that EpisodicMemory initializes with the required `event_time` and `recalled` fields."""
-        event_time = datetime.now().isoformat(timespec="seconds")
+        event_time = ISO_NOW
         episodic_memory = EpisodicMemory(
             head_label="Person",
             tail_label="Event",
@@ -215,7 +240,7 @@ class TestEpisodicMemory(unittest.TestCase):
 class TestSemanticMemory(unittest.TestCase):
     def test_semantic_memory_initialization(self):
         """Test that SemanticMemory initializes with the required `known_since`, `derived_from`, and `recalled` fields."""
-        known_since = datetime.now().isoformat(timespec="seconds")
+        known_since = ISO_NOW
         semantic_memory = SemanticMemory(
             head_label="Person",
             tail_label="Knowledge",
@@ -245,7 +270,7 @@ class TestSemanticMemory(unittest.TestCase):
 
     def test_semantic_memory_missing_derived_from(self):
         """Test that SemanticMemory raises an AssertionError if `derived_from` is missing."""
-        known_since = datetime.now().isoformat(timespec="seconds")
+        known_since = ISO_NOW
         with self.assertRaises(AssertionError) as context:
             SemanticMemory(
                 head_label="Person",
@@ -0,0 +1,31 @@
+import unittest
+
+from humemai.utils import is_iso8601_datetime
+
+
+class TestIsIso8601Datetime(unittest.TestCase):
+    def test_valid(self):
+        """Test the strings that `datetime.strptime` accepts with seconds precision."""
+        for value in (
+            "2024-04-27T15:00:00",
+            "2024-4-27T15:00:00",  # one-digit month
+            "2024-04-7T5:0:0",  # one-digit day, hour, minute and second
+        ):
+            with self.subTest(value=value):
+                self.assertTrue(is_iso8601_datetime(value))
+
+    def test_invalid(self):
+        """Test that other ISO 8601 forms and out-of-range fields are rejected."""
+        for value in (
+            "yesterday at noon",
+            "2024-13-01T10:00:00",  # month out of range
+            "2024-02-30T10:00:00",  # day out of range
+            "2024-W17-6T15:00:00",  # week date
+            "2024-04-27T15:00+01",  # UTC offset instead of seconds
+            "2024-04-27T150000.0",  # basic format with fractional seconds
+            "2024-04-27T15:00:00.123456",  # microseconds
+            "2024-04-27 15:00:00",  # space instead of T
+        ):
+            with self.subTest(value=value):
+                self.assertFalse(is_iso8601_datetime(value))
+